@@ -2,6 +2,7 @@ from pyforecast.application.services.forecast_service import (
     ForecastRequest,
     ForecastResult,
     forecast_prophet,
+    warm_forecast_backend,
 )
 from pyforecast.application.services.ingest_service import IngestService, IngestedData
 from pyforecast.application.services.key_service import (
@@ -37,4 +38,5 @@ __all__ = [
     "ForecastRequest",
     "ForecastResult",
     "forecast_prophet",
+    "warm_forecast_backend",
 ]
\ No newline at end of file
@@ -53,6 +53,18 @@ def _require_prophet():
             raise ForecastError("Prophet is required. Install with: pip install -e '.[ml]'") from exc
 
 
+def warm_forecast_backend() -> bool:
+    """
+    Import Prophet ahead of time (its first import is slow: pandas + Stan backend).
+    Safe to call from a background thread; returns False if Prophet is unavailable.
+    """
+    try:
+        _require_prophet()
+    except ForecastError:
+        return False
+    return True
+
+
 def _validate_req(req: ForecastRequest) -> None:
     if not req.canonical_path.exists():
         raise ForecastError(f"Canonical file not found: {req.canonical_path}")
@@ -13,7 +13,7 @@ log = get_logger(__name__)
 class IngestedData:
     path: Path
     file_type: str  # "csv" | "xlsx"
-    columns: list[str]
+    columns: tuple[str, ...]
     preview_rows: list[dict[str, object]]
     row_count_estimate: int | None
 
@@ -46,8 +46,10 @@ class IngestService:
             ) from exc
 
         try:
-            lf = pl.scan_csv(path, infer_schema_length=10_000, ignore_errors=True)
-            cols = list(lf.columns)
+            # Read as Utf8, like the transform does: the preview (and the cd_key preview built
+            # from it) must show the same strings the output will contain (e.g. store "01").
+            lf = pl.scan_csv(path, infer_schema_length=0)
+            cols = tuple(lf.collect_schema().names())
             preview_df = lf.head(self._preview_n).collect()
             preview_rows = preview_df.to_dicts()
             row_est = None
@@ -91,7 +93,7 @@ class IngestService:
             if not rows:
                 raise FileFormatError("Excel sheet is empty.")
 
-            headers = [str(x).strip() for x in rows[0]]
+            headers = tuple(str(x).strip() for x in rows[0])
             data_rows = rows[1 : 1 + self._preview_n]
 
             preview_rows: list[dict[str, object]] = []
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from datetime import date, datetime
-from typing import Iterable
 
 from pyforecast.domain.timefreq import FrequencyResult, TimeFrequency, infer_frequency
 from pyforecast.infrastructure.logging import get_logger
@@ -36,7 +36,7 @@ class ProfilingService:
     def __init__(self, sample_limit: int = 200) -> None:
         self._sample_limit = sample_limit
 
-    def profile(self, columns: list[str], preview_rows: list[dict[str, object]]) -> ProfileResult:
+    def profile(self, columns: Sequence[str], preview_rows: list[dict[str, object]]) -> ProfileResult:
         shape = self._infer_shape(columns, preview_rows)
 
         date_candidates = self._find_date_candidates(columns, preview_rows)
@@ -68,7 +68,7 @@ class ProfilingService:
 
     # ---------- shape & candidates ----------
 
-    def _infer_shape(self, columns: list[str], preview_rows: list[dict[str, object]]) -> str:
+    def _infer_shape(self, columns: Sequence[str], preview_rows: list[dict[str, object]]) -> str:
         """
         Heuristic:
         - If we have a clear date column candidate AND a clear value-like column candidate => long
@@ -83,7 +83,7 @@ class ProfilingService:
         date_cands = self._find_date_candidates(columns, preview_rows)
         return "long" if date_cands else "wide"
 
-    def _find_date_candidates(self, columns: list[str], preview_rows: list[dict[str, object]]) -> list[str]:
+    def _find_date_candidates(self, columns: Sequence[str], preview_rows: list[dict[str, object]]) -> list[str]:
         """
         Return columns that look like they contain date values.
         Conservative: only returns candidates that parse in at least ~30% of sampled rows.
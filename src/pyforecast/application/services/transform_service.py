@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
 from pyforecast.domain.canonical_schema import CANON
 from pyforecast.domain.errors import FileFormatError, TransformationError
@@ -11,9 +13,9 @@ from pyforecast.infrastructure.logging import get_logger
 log = get_logger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, kw_only=True)
 class TransformRequest:
-    path: Path
+    path: Path | BinaryIO  # in-memory buffers are accepted for csv/ipc
     file_type: str
     shape: str
     date_col: str
@@ -22,6 +24,7 @@ class TransformRequest:
     key_separator: str = "|"
     out_dir: Path | None = None
     out_format: str = "parquet"
+    parquet_engine: str = "polars"  # "polars" | "pyarrow"
 
 
 @dataclass(frozen=True)
@@ -31,6 +34,21 @@ class TransformResult:
     notes: str | None = None
 
 
+# Outputs estimated above this size are written with a streaming sink (bounded memory) instead
+# of collect().write_parquet(), which is much faster for small/medium outputs.
+_STREAMING_WRITE_MIN_BYTES = 512 * 1024 * 1024
+_STREAMING_ROW_GROUP_SIZE = 100_000
+
+# Results of recent transforms, keyed by request + input file signature (see _cache_key).
+_RESULT_CACHE_SIZE = 32
+_result_cache: OrderedDict[tuple, tuple[TransformResult, tuple[int, int]]] = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+# Output column order is part of the contract: both shapes select exactly this.
+_CANON_COLUMNS = (CANON.cd_key, CANON.ds, CANON.y)
+
+_OUT_SUFFIXES = {"parquet": ".parquet", "csv": ".csv", "ipc": ".arrow"}
+
 _DATE_FMTS_DATE = (
     "%Y-%m-%d",
     "%Y/%m/%d",
@@ -51,6 +69,26 @@ _DATE_FMTS_MONTH = (
 )
 
 
+# Common wide-header shapes with a known format, keyed by length: parsed with one
+# explicit-format to_date instead of the try-every-format coalesce.
+_HEADER_FORMATS = {10: "%Y-%m-%d", 7: "%Y-%m", 8: "%Y%m%d"}
+
+
+def _detect_header_format(headers: list[str]) -> str | None:
+    n = len(headers[0].strip())
+    fmt = _HEADER_FORMATS.get(n)
+    if fmt is None:
+        return None
+    for h in headers:
+        h = h.strip()
+        if len(h) != n:
+            return None
+        # YYYYMMDD is all digits; the dashed shapes have '-' right after the year.
+        if not (h.isdigit() if n == 8 else h[4] == "-" and h.replace("-", "").isdigit()):
+            return None
+    return fmt
+
+
 def _require_polars() -> "pl":  # type: ignore[name-defined]
     try:
         import polars as pl  # type: ignore
@@ -60,14 +98,17 @@ def _require_polars() -> "pl":  # type: ignore[name-defined]
 
 
 def _validate_input(req: TransformRequest) -> None:
-    if not req.path.exists():
+    if isinstance(req.path, Path) and not req.path.exists():
         raise FileFormatError(f"Input file not found: {req.path}")
 
     if req.shape not in {"long", "wide"}:
         raise TransformationError(f"Invalid shape '{req.shape}'. Expected 'long' or 'wide'.")
 
-    if req.out_format not in {"parquet", "csv"}:
-        raise TransformationError(f"Unsupported out_format '{req.out_format}' (parquet/csv).")
+    if req.out_format not in _OUT_SUFFIXES:
+        raise TransformationError(f"Unsupported out_format '{req.out_format}' (parquet/csv/ipc).")
+
+    if req.parquet_engine not in {"polars", "pyarrow"}:
+        raise TransformationError(f"Unsupported parquet_engine '{req.parquet_engine}' (polars/pyarrow).")
 
     if req.shape == "long" and not req.value_col:
         raise TransformationError("value_col is required when shape='long'.")
@@ -100,13 +141,32 @@ def _normalise_cell(v: Any) -> str | None:
     return s
 
 
-def _scan_input(pl: "pl", path: Path, file_type: str) -> "pl.LazyFrame":
+def _input_stem(src: Path | BinaryIO) -> str:
+    return src.stem if isinstance(src, Path) else "input"
+
+
+def _input_size(src: Path | BinaryIO) -> int:
+    if isinstance(src, Path):
+        return src.stat().st_size
+    getbuffer = getattr(src, "getbuffer", None)  # io.BytesIO
+    return getbuffer().nbytes if getbuffer is not None else 0
+
+
+def _scan_input(pl: "pl", path: Path | BinaryIO, file_type: str) -> "pl.LazyFrame":
     ft = file_type.lower()
     if ft == "csv":
-        # keep this streaming-friendly; casting happens later in the pipeline
-        return pl.scan_csv(path, infer_schema_length=10_000, ignore_errors=True)
+        # keep this streaming-friendly; casting happens later in the pipeline.
+        # Every column is re-parsed downstream (keys -> Utf8, ds/y parsers accept strings),
+        # so read all as Utf8 and skip the dtype-inference pass (keys keep leading zeros).
+        return pl.scan_csv(path, infer_schema_length=0)
+
+    if ft == "ipc":
+        # Arrow IPC is already typed and columnar: no tokenizer or dtype inference.
+        return pl.scan_ipc(path)
 
     if ft == "xlsx":
+        if not isinstance(path, Path):
+            raise FileFormatError("Excel input must be a file path.")
         try:
             from python_calamine import CalamineWorkbook  # type: ignore
         except Exception as exc:
@@ -149,7 +209,7 @@ def _scan_input(pl: "pl", path: Path, file_type: str) -> "pl.LazyFrame":
         )
         return df.lazy()
 
-    raise FileFormatError(f"Unsupported file_type '{file_type}' (expected csv/xlsx).")
+    raise FileFormatError(f"Unsupported file_type '{file_type}' (expected csv/ipc/xlsx).")
 
 
 def _collect_columns_fast(lf: "pl.LazyFrame") -> list[str]:
@@ -191,6 +251,21 @@ def _parse_ds_expr(pl: "pl", col_name: str) -> "pl.Expr":
     return pl.coalesce([cast_date, *date_tries, *month_date_tries, excel_date]).alias(CANON.ds)
 
 
+def _parse_header_dates(pl: "pl", headers: list[str]) -> dict[str, Any]:
+    """
+    Parse wide period headers once (O(headers) instead of O(headers * rows)),
+    using the same rules as _parse_ds_expr. Unparseable headers are left out.
+    """
+    fmt = _detect_header_format(headers) if headers else None
+    if fmt is not None:
+        expr = pl.col(CANON.ds).str.strip_chars().str.to_date(format=fmt, strict=False)
+    else:
+        expr = _parse_ds_expr(pl, CANON.ds)
+
+    parsed = pl.DataFrame({CANON.ds: headers}, schema={CANON.ds: pl.Utf8}).select(expr).to_series().to_list()
+    return {h: d for h, d in zip(headers, parsed, strict=True) if d is not None}
+
+
 def _parse_y_expr(pl: "pl", col_name: str) -> "pl.Expr":
     """
     Optional improvement:
@@ -213,11 +288,113 @@ def _parse_y_expr(pl: "pl", col_name: str) -> "pl.Expr":
 def _default_output_path(req: TransformRequest) -> Path:
     out_dir = req.out_dir or (Path.home() / ".pyforecast" / "outputs")
     out_dir.mkdir(parents=True, exist_ok=True)
-    suffix = ".parquet" if req.out_format == "parquet" else ".csv"
-    return out_dir / f"{req.path.stem}__canonical_long{suffix}"
+    return out_dir / f"{_input_stem(req.path)}__canonical_long{_OUT_SUFFIXES[req.out_format]}"
+
+
+def _sink_parquet_streaming(lf: "pl.LazyFrame", out_path: Path) -> None:
+    # Batch the streamed morsels into large row groups. Set per query: a global
+    # pl.Config would leak into other queries (this runs on a pool thread).
+    lf.sink_parquet(out_path, row_group_size=_STREAMING_ROW_GROUP_SIZE)
+
+
+def _write_output(
+    lf: "pl.LazyFrame",
+    out_path: Path,
+    out_format: str,
+    parquet_engine: str = "polars",
+    est_output_bytes: int = 0,
+) -> None:
+    if out_format == "parquet" and parquet_engine == "polars" and est_output_bytes >= _STREAMING_WRITE_MIN_BYTES:
+        _sink_parquet_streaming(lf, out_path)
+    elif out_format == "parquet":
+        # Unpivot over many input batches yields a heavily chunked frame; the parquet
+        # writer degrades badly on those, so hand it one contiguous chunk per column.
+        df = lf.collect().rechunk()
+        if parquet_engine == "pyarrow":
+            # Usually faster for string-heavy output (cd_key); needs the 'data' extra.
+            df.write_parquet(out_path, use_pyarrow=True, compression="snappy")
+        else:
+            df.write_parquet(out_path)
+    elif out_format == "ipc":
+        lf.sink_ipc(out_path, compression=None)
+    else:
+        lf.sink_csv(out_path)
+
+
+def _file_signature(path: Path) -> tuple[int, int]:
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _cache_key(req: TransformRequest) -> tuple | None:
+    """Only file inputs are cacheable; the input's mtime/size invalidate stale entries."""
+    if not isinstance(req.path, Path) or not req.path.exists():
+        return None
+    return (
+        str(req.path.resolve()),
+        _file_signature(req.path),
+        req.file_type,
+        req.shape,
+        req.date_col,
+        req.value_col,
+        tuple(req.key_parts),
+        req.key_separator,
+        req.out_dir,
+        req.out_format,
+        req.parquet_engine,
+    )
+
+
+def _cached_result(key: tuple) -> TransformResult | None:
+    with _result_cache_lock:
+        hit = _result_cache.get(key)
+        if hit is None:
+            return None
+        res, out_sig = hit
+        # Another request (e.g. different key_parts) may have rewritten the same output file.
+        try:
+            valid = _file_signature(res.output_path) == out_sig
+        except OSError:
+            valid = False
+        if not valid:
+            del _result_cache[key]
+            return None
+        _result_cache.move_to_end(key)
+        return res
+
+
+def _store_result(key: tuple, res: TransformResult) -> None:
+    with _result_cache_lock:
+        # res just rewrote its output file, so any other entry pointing there is stale. The
+        # signature check can't catch this on coarse-mtime filesystems when sizes match
+        # (e.g. the same request with key_parts swapped).
+        for other in [k for k, (r, _) in _result_cache.items() if r.output_path == res.output_path]:
+            del _result_cache[other]
+        _result_cache[key] = (res, _file_signature(res.output_path))
+        if len(_result_cache) > _RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
 
 
 def transform_to_canonical_long(req: TransformRequest) -> TransformResult:
+    """
+    Transform req's input into the canonical long format and write it to disk.
+    Re-running an identical request on an unchanged input file returns the previous
+    result without redoing the work, as long as its output file is untouched.
+    """
+    key = _cache_key(req)
+    if key is not None:
+        cached = _cached_result(key)
+        if cached is not None:
+            log.info("transform_cache_hit", extra={"in_path": str(req.path), "out_path": str(cached.output_path)})
+            return cached
+
+    res = _transform_to_canonical_long(req)
+    if key is not None:
+        _store_result(key, res)
+    return res
+
+
+def _transform_to_canonical_long(req: TransformRequest) -> TransformResult:
     pl = _require_polars()
     _validate_input(req)
 
@@ -237,10 +414,11 @@ def transform_to_canonical_long(req: TransformRequest) -> TransformResult:
                 lf.with_columns(_build_cd_key_expr(pl, req.key_parts, req.key_separator))
                 .with_columns(_parse_ds_expr(pl, req.date_col))
                 .with_columns(_parse_y_expr(pl, req.value_col))
-                .select([CANON.cd_key, CANON.ds, CANON.y])
+                .select(_CANON_COLUMNS)
                 .drop_nulls([CANON.ds])
             )
             notes = None
+            growth = 1
 
         else:
             key_set = set(req.key_parts)
@@ -254,6 +432,8 @@ def transform_to_canonical_long(req: TransformRequest) -> TransformResult:
                     "Wide transform requires at least one date-like period column besides key columns."
                 )
 
+            header_ds = _parse_header_dates(pl, period_cols)
+
             unpivoted = lf.unpivot(
                 index=req.key_parts,
                 on=period_cols,
@@ -263,17 +443,18 @@ def transform_to_canonical_long(req: TransformRequest) -> TransformResult:
 
             lf2 = (
                 unpivoted.with_columns(_build_cd_key_expr(pl, req.key_parts, req.key_separator))
-                .with_columns(_parse_ds_expr(pl, CANON.ds))  # parse ds from header strings
+                # ds from the pre-parsed headers: a lookup per row, no per-row strptime
+                .with_columns(pl.col(CANON.ds).replace_strict(header_ds, default=None, return_dtype=pl.Date))
                 .with_columns(_parse_y_expr(pl, CANON.y))
-                .select([CANON.cd_key, CANON.ds, CANON.y])
+                .select(_CANON_COLUMNS)
                 .drop_nulls([CANON.ds])
             )
             notes = "Wide transform: ds inferred from column headers (supports YYYYMMDD and YYYY-MM)."
+            # Unpivot repeats every row's keys once per period column (y stays a string until
+            # parsed), so the collected frame scales with input size x period columns.
+            growth = len(period_cols)
 
-        if req.out_format == "parquet":
-            lf2.sink_parquet(out_path)
-        else:
-            lf2.sink_csv(out_path)
+        _write_output(lf2, out_path, req.out_format, req.parquet_engine, _input_size(req.path) * growth)
 
         log.info(
             "transform_ok",
@@ -286,12 +467,13 @@ def transform_to_canonical_long(req: TransformRequest) -> TransformResult:
         )
         return TransformResult(
             output_path=out_path,
-            canonical_columns=[CANON.cd_key, CANON.ds, CANON.y],
+            canonical_columns=list(_CANON_COLUMNS),
             notes=notes,
         )
 
     except Exception as exc:
         log.exception("transform_failed", extra={"in_path": str(req.path), "error": str(exc)})
+        name = req.path.name if isinstance(req.path, Path) else "<in-memory input>"
         raise TransformationError(
-            f"Failed to transform '{req.path.name}' to canonical long format. (input={req.path})"
+            f"Failed to transform '{name}' to canonical long format. (input={req.path})"
         ) from exc
\ No newline at end of file
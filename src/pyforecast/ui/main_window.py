@@ -1,11 +1,14 @@
 # main_window.py
 from __future__ import annotations
 
+import importlib
 import os
 import subprocess
 import sys
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
@@ -29,14 +32,21 @@ from pyforecast.application.services import (
     ForecastRequest,
     IngestService,
     IngestedData,
+    ProfileResult,
     ProfilingService,
     TransformRequest,
+    warm_forecast_backend,
 )
 from pyforecast.application.services.config_service import AppConfig, ConfigService
 from pyforecast.domain.canonical_schema import CANON
 from pyforecast.domain.timefreq import TimeFrequency
 from pyforecast.infrastructure.logging import get_logger
-from pyforecast.ui.workers import ThreadHandle, start_forecast_thread, start_transform_thread
+from pyforecast.ui.workers import (
+    ThreadHandle,
+    run_in_background,
+    start_forecast_thread,
+    start_transform_thread,
+)
 from pyforecast.ui.widgets import (
     ColumnMapper,
     ColumnMapping,
@@ -51,6 +61,55 @@ from pyforecast.ui.widgets import (
 
 log = get_logger(__name__)
 
+# Shared label styles, applied once on the window via object-name selectors.
+_TITLE_QSS = "font-size: 14px;"
+_SUBTITLE_QSS = "color: #9aa;"
+_BOX_QSS = "padding: 8px; border: 1px solid #2b2b2b; border-radius: 8px; color: #ddd;"
+_BOX_SOFT_QSS = "color: #ddd;"
+_MUTED_QSS = "color: #bbb;"
+_OUTPUT_PATH_QSS = "padding: 6px 10px; border: 1px solid #333; border-radius: 8px; color: #ddd;"
+_QUIT_QSS = "background-color: #b33939; color: white; border-radius: 8px; padding: 6px 12px;"
+_QUIT_HOVER_QSS = "background-color: #d64545;"
+_QUIT_PRESSED_QSS = "background-color: #8f2d2d;"
+
+# Above this many canonical rows, history points are estimated (HyperLogLog) instead of counted.
+_EXACT_UNIQUE_MAX_ROWS = 100_000
+
+# Profiles kept for re-loads of the same file (keyed by path, mtime, column count).
+_PROFILE_CACHE_SIZE = 8
+
+
+def _set_text(widget: QLabel, text: object) -> None:
+    """Set label text only when it changed (avoids needless relayout/repaint)."""
+    text = str(text)
+    if widget.text() != text:
+        widget.setText(text)
+
+
+def _set_enabled(widget: QWidget, enabled: bool) -> None:
+    """Toggle enabled state only when it changed."""
+    if widget.isEnabled() != enabled:
+        widget.setEnabled(enabled)
+
+
+def _load_preview_and_stats(pl, path: Path, n: int) -> tuple[Any, int, bool]:
+    """
+    Load the first `n` canonical rows and count distinct ds values in one batched collect.
+    Returns (preview_df, n_dates, approximate); large files use approx_n_unique (single-pass,
+    constant memory) since the count only drives the horizon recommendation.
+    """
+    lf = pl.scan_parquet(path)
+    n_rows = int(lf.select(pl.len()).collect().item())  # served from parquet metadata
+
+    ds = pl.col(CANON.ds)
+    approx = n_rows > _EXACT_UNIQUE_MAX_ROWS
+    n_unique = ds.approx_n_unique() if approx else ds.n_unique()
+
+    # collect_all runs both plans together; common-subplan elimination (on by default)
+    # lets them share the parquet scan.
+    preview_df, stats = pl.collect_all([lf.head(n), lf.select(n_unique.alias("n_dates"))])
+    return preview_df, int(stats.item()), approx
+
 
 @dataclass(frozen=True)
 class AppPaths:
@@ -82,6 +141,9 @@ class MainWindow(QMainWindow):
         # -----------------------------
         self._ingest_service = IngestService(preview_n=200)
         self._profiling_service = ProfilingService(sample_limit=200)
+        self._profile_cache: OrderedDict[tuple[str, int, int], ProfileResult] = OrderedDict()
+        # Polars' extension init is slow on first import; pay it off the UI thread at startup.
+        self._polars_future = run_in_background(importlib.import_module, "polars")
 
         self._last_ingested: IngestedData | None = None
         self._last_mapping: ColumnMapping | None = None
@@ -91,6 +153,8 @@ class MainWindow(QMainWindow):
         self._last_history_points: int | None = None
         self._last_forecast_cfg: ForecastConfig = ForecastConfig(enabled=False, horizon=12)
         self._last_forecast_out_dir: Path | None = None
+        self._forecast_warmed = False
+        self._last_output_str: str | None = None
 
         self._current_task: ThreadHandle | None = None
         self._current_task_kind: str | None = None
@@ -114,16 +178,14 @@ class MainWindow(QMainWindow):
 
         self._lbl_project = QLabel(f"Project: <span style='color:#aaa;'>{self._paths.base_dir.name}</span>")
         self._lbl_project.setTextFormat(Qt.RichText)
-        self._lbl_project.setStyleSheet("color: #bbb;")
+        self._lbl_project.setObjectName("muted")
         header_layout.addWidget(self._lbl_project)
 
         header_layout.addStretch(1)
 
         self._lbl_output = QLabel("")
         self._lbl_output.setTextFormat(Qt.PlainText)
-        self._lbl_output.setStyleSheet(
-            "padding: 6px 10px; border: 1px solid #333; border-radius: 8px; color: #ddd;"
-        )
+        self._lbl_output.setObjectName("outputPath")
         header_layout.addWidget(self._lbl_output)
 
         self._btn_change_output = QPushButton("Change")
@@ -136,20 +198,7 @@ class MainWindow(QMainWindow):
 
         self._btn_quit = QPushButton("Quit")
         self._btn_quit.clicked.connect(self.close)
-        self._btn_quit.setStyleSheet("""
-            QPushButton {
-                background-color: #b33939;
-                color: white;
-                border-radius: 8px;
-                padding: 6px 12px;
-            }
-            QPushButton:hover {
-                background-color: #d64545;
-            }
-            QPushButton:pressed {
-                background-color: #8f2d2d;
-            }
-        """)
+        self._btn_quit.setObjectName("quitButton")
         header_layout.addWidget(self._btn_quit)
 
         root_layout.addWidget(header)
@@ -179,12 +228,12 @@ class MainWindow(QMainWindow):
         left_title_layout.setSpacing(8)
 
         left_title = QLabel("<b>Configuration</b>")
-        left_title.setStyleSheet("font-size: 14px;")
+        left_title.setObjectName("panelTitle")
         left_title_layout.addWidget(left_title)
         left_title_layout.addStretch(1)
 
         self._lbl_step = QLabel("Step 1 of 4")
-        self._lbl_step.setStyleSheet("color: #9aa;")
+        self._lbl_step.setObjectName("panelSubtitle")
         left_title_layout.addWidget(self._lbl_step)
 
         left_layout.addWidget(left_title_row)
@@ -194,13 +243,14 @@ class MainWindow(QMainWindow):
         box_source_layout = QVBoxLayout(box_source)
 
         self._file_picker = FilePickerButton(parent=self, ingest=self._ingest_service)
+        self._file_picker.ingest_started.connect(self._on_ingest_started)
         self._file_picker.ingested.connect(self._on_ingested)
+        self._file_picker.failed.connect(self._on_ingest_ended)
+        self._file_picker.cancelled.connect(self._on_ingest_ended)
 
         self._ingest_info = QLabel("No file loaded.")
         self._ingest_info.setWordWrap(True)
-        self._ingest_info.setStyleSheet(
-            "padding: 8px; border: 1px solid #2b2b2b; border-radius: 8px; color: #ddd;"
-        )
+        self._ingest_info.setObjectName("infoBox")
 
         box_source_layout.addWidget(self._file_picker)
         box_source_layout.addWidget(self._ingest_info)
@@ -212,9 +262,7 @@ class MainWindow(QMainWindow):
 
         self._profile_info = QLabel("Profile: (not available)")
         self._profile_info.setWordWrap(True)
-        self._profile_info.setStyleSheet(
-            "padding: 8px; border: 1px solid #2b2b2b; border-radius: 8px; color: #ddd;"
-        )
+        self._profile_info.setObjectName("infoBox")
         box_profile_layout.addWidget(self._profile_info)
         left_layout.addWidget(box_profile)
 
@@ -241,9 +289,7 @@ class MainWindow(QMainWindow):
         self._transform_info.setTextFormat(Qt.RichText)
         self._transform_info.setTextInteractionFlags(Qt.TextSelectableByMouse)
         self._transform_info.setMaximumWidth(420)  # adjust if needed
-        self._transform_info.setStyleSheet(
-            "padding: 8px; border: 1px solid #2b2b2b; border-radius: 8px; color: #ddd;"
-        )
+        self._transform_info.setObjectName("infoBox")
 
         box_actions_layout.addWidget(self._btn_transform)
         box_actions_layout.addWidget(self._transform_info)
@@ -305,7 +351,7 @@ class MainWindow(QMainWindow):
         self._progress_label = QLabel("")
         self._progress_label.setWordWrap(True)
         self._progress_label.setVisible(False)
-        self._progress_label.setStyleSheet("color: #ddd;")
+        self._progress_label.setObjectName("softBox")
 
         btn_row = QWidget(box_task)
         btn_row_layout = QHBoxLayout(btn_row)
@@ -327,7 +373,7 @@ class MainWindow(QMainWindow):
 
         self._forecast_info = QLabel("Forecast: (not run)")
         self._forecast_info.setWordWrap(True)
-        self._forecast_info.setStyleSheet("color: #ddd;")
+        self._forecast_info.setObjectName("softBox")
 
         box_task_layout.addWidget(self._progress)
         box_task_layout.addWidget(self._progress_label)
@@ -353,7 +399,8 @@ class MainWindow(QMainWindow):
 
     
     def _apply_theme(self) -> None:
-        self.setStyleSheet("""
+        self.setStyleSheet(
+            """
             QWidget {
                 background-color: #0c1014;
                 color: #e6f2f2;
@@ -422,7 +469,7 @@ class MainWindow(QMainWindow):
                 border-radius: 6px;
             }
 
-            QTableWidget {
+            QTableView {
                 background-color: #10161b;
                 gridline-color: #1b242a;
             }
@@ -433,7 +480,17 @@ class MainWindow(QMainWindow):
                 padding: 4px;
                 border: none;
             }
-        """)
+        """
+            f"QLabel#panelTitle {{{_TITLE_QSS}}}"
+            f"QLabel#panelSubtitle {{{_SUBTITLE_QSS}}}"
+            f"QLabel#infoBox {{{_BOX_QSS}}}"
+            f"QLabel#softBox {{{_BOX_SOFT_QSS}}}"
+            f"QLabel#muted {{{_MUTED_QSS}}}"
+            f"QLabel#outputPath {{{_OUTPUT_PATH_QSS}}}"
+            f"QPushButton#quitButton {{{_QUIT_QSS}}}"
+            f"QPushButton#quitButton:hover {{{_QUIT_HOVER_QSS}}}"
+            f"QPushButton#quitButton:pressed {{{_QUIT_PRESSED_QSS}}}"
+        )
     # -----------------------------
     # Output directory
     # -----------------------------
@@ -446,16 +503,25 @@ class MainWindow(QMainWindow):
         self._refresh_output_label()
 
     def _refresh_output_label(self) -> None:
-        self._lbl_output.setText(str(self._paths.outputs_dir))
-        self.statusBar().showMessage(f"Outputs: {self._paths.outputs_dir}")
+        out_str = str(self._paths.outputs_dir)
+        if out_str == self._last_output_str:
+            return
+        self._last_output_str = out_str
+        self._lbl_output.setText(out_str)
+        self.statusBar().showMessage(f"Outputs: {out_str}")
 
     def _choose_output_dir(self) -> None:
         if self._current_task is not None and self._current_task.is_running():
             QMessageBox.information(self, "Busy", "Wait for the current task to finish or cancel it first.")
             return
 
-        start_dir = str(self._paths.outputs_dir)
-        chosen = QFileDialog.getExistingDirectory(self, "Select Output Folder", start_dir)
+        start_dir = self._last_output_str or str(self._paths.outputs_dir)
+        chosen = QFileDialog.getExistingDirectory(
+            self,
+            "Select Output Folder",
+            start_dir,
+            options=QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontUseCustomDirectoryIcons,
+        )
         if not chosen:
             return
 
@@ -486,40 +552,49 @@ class MainWindow(QMainWindow):
     def _set_busy(self, kind: str, msg: str) -> None:
         self._current_task_kind = kind
 
-        self._progress.setVisible(True)
-        self._progress_label.setVisible(True)
-        self._btn_cancel.setVisible(True)
-
-        self._btn_cancel.setEnabled(True)
-        self._progress.setValue(0)
-        self._progress_label.setText(msg)
-
-        # Lock UI
-        self._file_picker.setEnabled(False)
-        self._btn_transform.setEnabled(False)
-        self._btn_forecast.setEnabled(False)
-        self._btn_change_output.setEnabled(False)
-        self._btn_open_output.setEnabled(False)
+        # Batch the visibility/enabled flips into a single repaint.
+        self.setUpdatesEnabled(False)
+        try:
+            self._progress.setVisible(True)
+            self._progress_label.setVisible(True)
+            self._btn_cancel.setVisible(True)
+
+            _set_enabled(self._btn_cancel, True)
+            self._progress.setValue(0)
+            self._progress_label.setText(msg)
+
+            # Lock UI
+            self._file_picker.setEnabled(False)
+            _set_enabled(self._btn_transform, False)
+            _set_enabled(self._btn_forecast, False)
+            _set_enabled(self._btn_change_output, False)
+            _set_enabled(self._btn_open_output, False)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _clear_busy(self) -> None:
         self._current_task_kind = None
         self._current_task = None
 
-        self._progress.setVisible(False)
-        self._progress_label.setVisible(False)
-        self._btn_cancel.setVisible(False)
-        self._btn_cancel.setEnabled(False)
-
-        # Unlock UI
-        self._file_picker.setEnabled(True)
-        self._btn_change_output.setEnabled(True)
-        self._btn_open_output.setEnabled(True)
-        self._refresh_actions()
+        self.setUpdatesEnabled(False)
+        try:
+            self._progress.setVisible(False)
+            self._progress_label.setVisible(False)
+            self._btn_cancel.setVisible(False)
+            _set_enabled(self._btn_cancel, False)
+
+            # Unlock UI
+            self._file_picker.setEnabled(True)
+            _set_enabled(self._btn_change_output, True)
+            _set_enabled(self._btn_open_output, True)
+            self._refresh_actions()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _cancel_current_task(self) -> None:
         if self._current_task is None or not self._current_task.is_running():
             return
-        self._btn_cancel.setEnabled(False)
+        _set_enabled(self._btn_cancel, False)
         self._progress_label.setText("Cancellation requested…")
         self._current_task.cancel()
 
@@ -530,6 +605,16 @@ class MainWindow(QMainWindow):
     # -----------------------------
     # Ingest / profile
     # -----------------------------
+    def _on_ingest_started(self, handle: ThreadHandle) -> None:
+        self._set_busy("ingest", "Loading file…")
+        self._current_task = handle
+        handle.runner.progress.connect(self._on_task_progress)
+
+    def _on_ingest_ended(self) -> None:
+        # Failure/cancel: the picker already reported it; just unlock the UI.
+        if self._current_task_kind == "ingest":
+            self._clear_busy()
+
     def _on_ingested(self, data: IngestedData) -> None:
         self._last_ingested = data
         self._last_mapping = None
@@ -539,12 +624,13 @@ class MainWindow(QMainWindow):
         self._last_history_points = None
         self._last_forecast_out_dir = None
 
-        self._transform_info.setText("Transform: (not run)")
-        self._forecast_info.setText("Forecast: (not run)")
+        _set_text(self._transform_info, "Transform: (not run)")
+        _set_text(self._forecast_info, "Forecast: (not run)")
         self._forecast_prompt.set_context(frequency=None, n_points=None)
 
         cols_preview = ", ".join(data.columns[:12]) + (" ..." if len(data.columns) > 12 else "")
-        self._ingest_info.setText(
+        _set_text(
+            self._ingest_info,
             f"<b>Loaded:</b> {data.path.name}<br>"
             f"<b>Type:</b> {data.file_type.upper()}<br>"
             f"<b>Rows (preview):</b> {len(data.preview_rows)}<br>"
@@ -557,7 +643,7 @@ class MainWindow(QMainWindow):
         self._tabs.setCurrentIndex(0)
 
         # Profile
-        profile = self._profiling_service.profile(data.columns, data.preview_rows)
+        profile = self._profile(data)
         self._last_profile_freq = profile.frequency.frequency if profile.frequency else None
 
         if profile.frequency:
@@ -574,7 +660,8 @@ class MainWindow(QMainWindow):
         if profile.notes:
             note_html = f"<span style='color:#aaa;'><i>Note:</i> {profile.notes}</span>"
 
-        self._profile_info.setText(
+        _set_text(
+            self._profile_info,
             "<b>Shape:</b> " + profile.shape + "<br>"
             f"<b>Date candidates:</b> {cand_txt}<br>"
             f"<b>Selected date:</b> {profile.inferred_date_column or 'None'}<br>"
@@ -583,14 +670,34 @@ class MainWindow(QMainWindow):
         )
 
         # Left: Steps context
-        self._lbl_step.setText("Step 1 of 4")
+        _set_text(self._lbl_step, "Step 1 of 4")
 
         self._column_mapper.set_context(columns=data.columns, profile=profile)
         self._key_builder.set_context(columns=data.columns, preview_rows=data.preview_rows)
 
         # Forecast prompt updated with freq (horizon recommendation may still need n_points)
         self._forecast_prompt.set_context(frequency=self._last_profile_freq, n_points=None)
-        self._refresh_actions()
+        if self._current_task_kind == "ingest":
+            self._clear_busy()  # also refreshes actions
+        else:
+            self._refresh_actions()
+
+    def _profile(self, data: IngestedData) -> ProfileResult:
+        try:
+            key = (str(data.path), data.path.stat().st_mtime_ns, len(data.columns))
+        except OSError:
+            return self._profiling_service.profile(data.columns, data.preview_rows)
+
+        cached = self._profile_cache.get(key)
+        if cached is not None:
+            self._profile_cache.move_to_end(key)
+            return cached
+
+        profile = self._profiling_service.profile(data.columns, data.preview_rows)
+        self._profile_cache[key] = profile
+        if len(self._profile_cache) > _PROFILE_CACHE_SIZE:
+            self._profile_cache.popitem(last=False)
+        return profile
 
     def _on_mapping_changed(self, mapping: ColumnMapping) -> None:
         self._last_mapping = mapping
@@ -602,6 +709,10 @@ class MainWindow(QMainWindow):
 
     def _on_forecast_cfg_changed(self, cfg: ForecastConfig) -> None:
         self._last_forecast_cfg = cfg
+        if cfg.enabled and not self._forecast_warmed:
+            # Pay the Prophet import cost in the background, not when "Run Forecast" is clicked.
+            self._forecast_warmed = True
+            run_in_background(warm_forecast_backend)
         self._refresh_actions()
 
     def _refresh_actions(self) -> None:
@@ -611,7 +722,7 @@ class MainWindow(QMainWindow):
         ready_to_transform = (
             self._last_ingested is not None and self._last_mapping is not None and self._last_key_sel is not None
         )
-        self._btn_transform.setEnabled(ready_to_transform)
+        _set_enabled(self._btn_transform, ready_to_transform)
 
         ready_to_forecast = (
             self._last_transform_path is not None
@@ -619,17 +730,17 @@ class MainWindow(QMainWindow):
             and self._last_forecast_cfg.enabled
             and self._last_forecast_cfg.horizon >= 1
         )
-        self._btn_forecast.setEnabled(ready_to_forecast)
+        _set_enabled(self._btn_forecast, ready_to_forecast)
 
         # Step label
         if self._last_ingested is None:
-            self._lbl_step.setText("Step 1 of 4")
+            _set_text(self._lbl_step, "Step 1 of 4")
         elif self._last_transform_path is None:
-            self._lbl_step.setText("Step 2 of 4")
+            _set_text(self._lbl_step, "Step 2 of 4")
         elif not self._last_forecast_cfg.enabled:
-            self._lbl_step.setText("Step 3 of 4")
+            _set_text(self._lbl_step, "Step 3 of 4")
         else:
-            self._lbl_step.setText("Step 4 of 4")
+            _set_text(self._lbl_step, "Step 4 of 4")
 
     # -----------------------------
     # Transform
@@ -662,12 +773,12 @@ class MainWindow(QMainWindow):
         handle.runner.finished.connect(self._on_transform_finished)
 
     def _on_transform_failed(self, message: str) -> None:
-        self._transform_info.setText("Transform: failed")
+        _set_text(self._transform_info, "Transform: failed")
         self._clear_busy()
         QMessageBox.warning(self, "Transform failed", message)
 
     def _on_transform_cancelled(self) -> None:
-        self._transform_info.setText("Transform: cancelled")
+        _set_text(self._transform_info, "Transform: cancelled")
         self._clear_busy()
         QMessageBox.information(self, "Cancelled", "Transform was cancelled.")
 
@@ -684,34 +795,31 @@ class MainWindow(QMainWindow):
         self._last_forecast_out_dir = None
 
         try:
-            import polars as pl
+            pl = self._polars_future.result()
         except Exception as exc:
             self._clear_busy()
             QMessageBox.warning(self, "Preview unavailable", f"Polars not available for preview: {exc}")
             return
 
-        df_prev = pl.read_parquet(self._last_transform_path).head(200)
-        self._tbl_canon.set_preview_rows(df_prev.to_dicts())
+        df_prev, n_dates, approx = _load_preview_and_stats(pl, self._last_transform_path, 200)
+        self._tbl_canon.set_preview_columns(df_prev.columns, [c.to_list() for c in df_prev.get_columns()])
         self._tabs.setCurrentIndex(1)
 
-        n_dates = (
-            pl.scan_parquet(self._last_transform_path)
-            .select(pl.col(CANON.ds).n_unique().alias("n"))
-            .collect()["n"][0]
-        )
-        self._last_history_points = int(n_dates)
+        self._last_history_points = n_dates
         self._forecast_prompt.set_context(frequency=self._last_profile_freq, n_points=self._last_history_points)
 
         freq_txt = self._last_profile_freq.name if self._last_profile_freq else "N/A"
+        points_txt = f"≈ {n_dates}" if approx else str(n_dates)
         note_html = ""
         if notes:
             note_html = f"<span style='color:#aaa;'><i>Note:</i> {notes}</span>"
 
-        self._transform_info.setText(
+        _set_text(
+            self._transform_info,
             "<b>Transform OK</b><br>"
             f"<span style='color:#aaa;'>Output:</span> {self._last_transform_path}<br>"
             f"<span style='color:#aaa;'>Columns:</span> {', '.join(canonical_cols)}<br>"
-            f"<span style='color:#aaa;'>History points (unique ds):</span> {self._last_history_points}<br>"
+            f"<span style='color:#aaa;'>History points (unique ds):</span> {points_txt}<br>"
             f"<span style='color:#aaa;'>Frequency:</span> {freq_txt}<br>"
             f"{note_html}"
         )
@@ -751,12 +859,12 @@ class MainWindow(QMainWindow):
         handle.runner.finished.connect(self._on_forecast_finished)
 
     def _on_forecast_failed(self, message: str) -> None:
-        self._forecast_info.setText("Forecast: failed")
+        _set_text(self._forecast_info, "Forecast: failed")
         self._clear_busy()
         QMessageBox.warning(self, "Forecast failed", message)
 
     def _on_forecast_cancelled(self) -> None:
-        self._forecast_info.setText("Forecast: cancelled")
+        _set_text(self._forecast_info, "Forecast: cancelled")
         self._clear_busy()
         QMessageBox.information(self, "Cancelled", "Forecast was cancelled.")
 
@@ -776,20 +884,28 @@ class MainWindow(QMainWindow):
         preview_err: str | None = None
 
         if series_files:
-            csv_first = next((Path(p) for p in series_files if str(p).lower().endswith(".csv")), None)
-            pq_first = next((Path(p) for p in series_files if str(p).lower().endswith(".parquet")), None)
+            # Single pass: prefer the first CSV, fall back to the first parquet.
+            csv_first: Path | None = None
+            pq_first: Path | None = None
+            for p in series_files:
+                name = str(p).lower()
+                if name.endswith(".csv"):
+                    csv_first = Path(p)
+                    break
+                if pq_first is None and name.endswith(".parquet"):
+                    pq_first = Path(p)
             chosen = csv_first or pq_first
 
             if chosen is not None:
                 try:
-                    import polars as pl
+                    pl = self._polars_future.result()
 
                     if chosen.suffix.lower() == ".parquet":
-                        df = pl.read_parquet(chosen).head(200)
+                        df = pl.scan_parquet(chosen).head(200).collect()
                     else:
-                        df = pl.read_csv(chosen).head(200)
+                        df = pl.scan_csv(chosen).head(200).collect()
 
-                    self._tbl_forecast.set_preview_rows(df.to_dicts())
+                    self._tbl_forecast.set_preview_columns(df.columns, [c.to_list() for c in df.get_columns()])
                     self._tabs.setCurrentIndex(2)
                     preview_loaded = True
                 except Exception as exc:
@@ -805,7 +921,8 @@ class MainWindow(QMainWindow):
         elif preview_err:
             preview_html = f"<br><span style='color:#f99;'><i>Preview error:</i> {preview_err}</span>"
 
-        self._forecast_info.setText(
+        _set_text(
+            self._forecast_info,
             "<b>Forecast OK</b><br>"
             f"<span style='color:#aaa;'>Output dir:</span> {out_dir}<br>"
             f"<span style='color:#aaa;'>Series files:</span> {len(series_files)} (CSV + Parquet)<br>"
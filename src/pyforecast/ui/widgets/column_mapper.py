@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Iterable
 
-from PySide6.QtCore import Qt, Signal  # ← FIX: import Qt here
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer, Signal, Slot  # ← FIX: import Qt here
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QComboBox,
     QFormLayout,
@@ -16,6 +18,9 @@ from PySide6.QtWidgets import (
 
 from pyforecast.application.services.profiling_service import ProfileResult
 
+# Substrings that suggest a value column (matched against lowercased names).
+_VALUE_HINT_RE = re.compile("value|valor|qty|qtd|volume|sales|y")
+
 
 @dataclass(frozen=True)
 class ColumnMapping:
@@ -31,7 +36,16 @@ class ColumnMapper(QWidget):
         super().__init__(parent)
 
         self._columns: list[str] = []
+        self._cols_lower: list[str] = []
+        self._columns_model: QStandardItemModel | None = None
         self._profile: ProfileResult | None = None
+        self._last_emitted: ColumnMapping | None = None
+
+        # Coalesce bursts of combo/radio changes into a single mapping_changed.
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(30)
+        self._emit_timer.timeout.connect(self._emit_mapping_now)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
@@ -80,37 +94,48 @@ class ColumnMapper(QWidget):
 
     def set_context(self, columns: Iterable[str], profile: ProfileResult | None = None) -> None:
         self._columns = list(columns)
+        self._cols_lower = [c.lower() for c in self._columns]
         self._profile = profile
 
-        self._cb_date.blockSignals(True)
-        self._cb_value.blockSignals(True)
+        self.setUpdatesEnabled(False)
         try:
-            self._cb_date.clear()
-            self._cb_value.clear()
-
-            self._cb_date.addItems(self._columns)
-            self._cb_value.addItems(self._columns)
-
-            if profile and profile.inferred_date_column and profile.inferred_date_column in self._columns:
-                self._cb_date.setCurrentText(profile.inferred_date_column)
-
-            guess_value = self._guess_value_column()
-            if guess_value:
-                self._cb_value.setCurrentText(guess_value)
+            with (
+                QSignalBlocker(self._cb_date),
+                QSignalBlocker(self._cb_value),
+                QSignalBlocker(self._rb_long),
+                QSignalBlocker(self._rb_wide),
+            ):
+                # One pre-built model shared by both combos (no per-item rowsInserted churn).
+                model = QStandardItemModel(len(self._columns), 1, self)
+                for i, c in enumerate(self._columns):
+                    model.setItem(i, QStandardItem(c))
+                self._cb_date.setModel(model)
+                self._cb_value.setModel(model)
+                if self._columns_model is not None:
+                    self._columns_model.deleteLater()
+                self._columns_model = model
+
+                if profile and profile.inferred_date_column and profile.inferred_date_column in self._columns:
+                    self._cb_date.setCurrentText(profile.inferred_date_column)
+
+                guess_value = self._guess_value_column()
+                if guess_value:
+                    self._cb_value.setCurrentText(guess_value)
+
+                if profile and profile.shape == "wide":
+                    self._rb_wide.setChecked(True)
+                else:
+                    self._rb_long.setChecked(True)
+
+            self._set_enabled(bool(self._columns))
         finally:
-            self._cb_date.blockSignals(False)
-            self._cb_value.blockSignals(False)
-
-        if profile and profile.shape in {"long", "wide"}:
-            if profile.shape == "wide":
-                self._rb_wide.setChecked(True)
-            else:
-                self._rb_long.setChecked(True)
-        else:
-            self._rb_long.setChecked(True)
+            self.setUpdatesEnabled(True)
 
-        self._set_enabled(bool(self._columns))
-        self._emit_mapping()
+        # Context reload is a single logical change: emit once, now, and drop any pending emit.
+        # Always emitted (consumers reset their state on reload), hence the memo reset.
+        self._emit_timer.stop()
+        self._last_emitted = None
+        self._emit_mapping_now()
 
     def mapping(self) -> ColumnMapping | None:
         if not self.isEnabled() or not self._columns:
@@ -138,11 +163,10 @@ class ColumnMapper(QWidget):
             else None
         )
 
-        for c in self._columns:
+        for c, cl in zip(self._columns, self._cols_lower, strict=True):
             if date_col and c == date_col:
                 continue
-            cl = c.lower()
-            if any(tok in cl for tok in ("value", "valor", "qty", "qtd", "volume", "sales", "y")):
+            if _VALUE_HINT_RE.search(cl):
                 return c
 
         for c in self._columns:
@@ -157,7 +181,14 @@ class ColumnMapper(QWidget):
         self._form_box.setEnabled(enabled)
         self.setEnabled(enabled)
 
+    @Slot()
     def _emit_mapping(self) -> None:
+        self._emit_timer.start()
+
+    @Slot()
+    def _emit_mapping_now(self) -> None:
         m = self.mapping()
-        if m is not None:
-            self.mapping_changed.emit(m)
\ No newline at end of file
+        if m is None or m == self._last_emitted:
+            return
+        self._last_emitted = m
+        self.mapping_changed.emit(m)
\ No newline at end of file
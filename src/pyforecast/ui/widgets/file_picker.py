@@ -3,12 +3,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, Slot
 from PySide6.QtWidgets import QFileDialog, QMessageBox, QPushButton
 
 from pyforecast.application.services import IngestService, IngestedData
-from pyforecast.domain.errors import PyForecastError
 from pyforecast.infrastructure.logging import get_logger
+from pyforecast.ui.workers import IngestWorker, ThreadHandle, start_ingest_thread
 
 log = get_logger(__name__)
 
@@ -20,8 +20,13 @@ class FilePickerConfig:
 
 
 class FilePickerButton(QPushButton):
+    ingest_started = Signal(object)  # ThreadHandle; the owner drives busy state/cancel from it
     ingested = Signal(object)  # IngestedData
     failed = Signal(str)  # error message
+    cancelled = Signal()
+
+    _IDLE_TEXT = "Open file (CSV / Excel)"
+    _BUSY_TEXT = "Loading file…"
 
     def __init__(
         self,
@@ -29,19 +34,26 @@ class FilePickerButton(QPushButton):
         ingest: IngestService,
         config: FilePickerConfig | None = None,
     ) -> None:
-        super().__init__("Open file (CSV / Excel)", parent=parent)
+        super().__init__(self._IDLE_TEXT, parent=parent)
         self._ingest = ingest
         self._cfg = config or FilePickerConfig()
+        self._task: ThreadHandle[IngestWorker] | None = None
         self.clicked.connect(self._on_click)
 
         self.setFixedHeight(40)
 
+    @Slot()
     def _on_click(self) -> None:
+        if self._task is not None and self._task.is_running():
+            return
+
         file_path, _ = QFileDialog.getOpenFileName(
             self.window(),
             self._cfg.title,
             str(Path.home()),
             self._cfg.filter_spec,
+            # Native dialog + no per-folder icon lookups: avoids stat storms in huge directories.
+            options=QFileDialog.Option.DontUseCustomDirectoryIcons | QFileDialog.Option.ReadOnly,
         )
         if not file_path:
             return
@@ -49,17 +61,41 @@ class FilePickerButton(QPushButton):
         path = Path(file_path)
         log.info("file_selected", extra={"path": str(path)})
 
-        try:
-            data = self._ingest.ingest(path)
-            self.ingested.emit(data)
-        except PyForecastError as exc:
-            msg = str(exc)
-            log.warning("ingest_failed", extra={"path": str(path), "error": msg})
-            self.failed.emit(msg)
-            QMessageBox.warning(self.window(), "Could not open file", msg)
-        except Exception as exc:
-            # last-resort to avoid UI crash
-            msg = f"Unexpected error while opening file: {exc}"
-            log.exception("ingest_failed_unexpected", extra={"path": str(path), "error": str(exc)})
-            self.failed.emit(msg)
-            QMessageBox.critical(self.window(), "Unexpected error", msg)
\ No newline at end of file
+        # Ingest off the UI thread; results come back as queued signals. Enabled state is
+        # left to the owner (MainWindow locks the whole UI from ingest_started).
+        self.setText(self._BUSY_TEXT)
+
+        handle = start_ingest_thread(self._ingest, path)
+        self._task = handle
+        runner = handle.runner
+        runner.finished.connect(self._on_ingest_finished)
+        runner.failed.connect(self._on_ingest_failed)
+        runner.failed_unexpected.connect(self._on_ingest_failed_unexpected)
+        runner.cancelled.connect(self._on_ingest_cancelled)
+        self.ingest_started.emit(handle)
+
+    @Slot(object)
+    def _on_ingest_finished(self, data: IngestedData) -> None:
+        self._on_ingest_done()
+        self.ingested.emit(data)
+
+    @Slot(str)
+    def _on_ingest_failed(self, msg: str) -> None:
+        self._on_ingest_done()
+        self.failed.emit(msg)
+        QMessageBox.warning(self.window(), "Could not open file", msg)
+
+    @Slot(str)
+    def _on_ingest_failed_unexpected(self, msg: str) -> None:
+        self._on_ingest_done()
+        self.failed.emit(msg)
+        QMessageBox.critical(self.window(), "Unexpected error", msg)
+
+    @Slot()
+    def _on_ingest_cancelled(self) -> None:
+        self._on_ingest_done()
+        self.cancelled.emit()
+
+    def _on_ingest_done(self) -> None:
+        self._task = None
+        self.setText(self._IDLE_TEXT)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
     QCheckBox,
     QFormLayout,
@@ -23,6 +24,24 @@ class ForecastConfig:
     horizon: int
 
 
+@functools.lru_cache(maxsize=512)
+def _recommended_horizon(n_points: int | None) -> int | None:
+    if n_points is None or n_points <= 3:
+        return None
+
+    if n_points < 20:
+        pct = 0.25
+    elif n_points < 100:
+        pct = 0.20
+    else:
+        pct = 0.15
+
+    horizon = max(1, int(n_points * pct))
+    horizon = min(horizon, max(1, n_points // 2))
+
+    return horizon
+
+
 class ForecastPrompt(QGroupBox):
 
     config_changed = Signal(ForecastConfig)
@@ -32,6 +51,14 @@ class ForecastPrompt(QGroupBox):
 
         self._frequency: TimeFrequency | None = None
         self._n_points: int | None = None
+        self._last_emitted: ForecastConfig | None = None
+        self._ctx_key: tuple[TimeFrequency | None, int | None] | None = None
+
+        # Coalesce bursts (spin-box stepping, set_context + valueChanged) into one emission.
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(0)
+        self._emit_timer.timeout.connect(self._emit_change_now)
 
         self._chk_enable = QCheckBox("Enable forecast")
         self._chk_enable.stateChanged.connect(self._emit_change)
@@ -68,47 +95,45 @@ class ForecastPrompt(QGroupBox):
         Update internal context (history size + frequency).
         Used to compute smarter recommended horizon.
         """
+        key = (frequency, n_points)
+        if key == self._ctx_key:
+            return
+        self._ctx_key = key
+
         self._frequency = frequency
         self._n_points = n_points
 
-        recommended = self._compute_recommended_horizon(n_points)
+        recommended = _recommended_horizon(n_points)
         if recommended is not None:
             self._spin_horizon.setValue(recommended)
 
         self._update_recommendation_label(recommended)
         self._emit_change()
 
-    def _compute_recommended_horizon(self, n_points: int | None) -> int | None:
-        if n_points is None or n_points <= 3:
-            return None
-
-        if n_points < 20:
-            pct = 0.25
-        elif n_points < 100:
-            pct = 0.20
-        else:
-            pct = 0.15
-
-        horizon = max(1, int(n_points * pct))
-        horizon = min(horizon, max(1, n_points // 2))
-
-        return horizon
-
     def _update_recommendation_label(self, recommended: int | None) -> None:
         if recommended is None:
-            self._lbl_recommendation.setText(
-                "Recommendation unavailable — insufficient historical data."
+            text = "Recommendation unavailable — insufficient historical data."
+        else:
+            text = (
+                f"Recommended horizon: <b>{recommended}</b> periods "
+                f"(based on {self._n_points} historical points)."
             )
-            return
 
-        self._lbl_recommendation.setText(
-            f"Recommended horizon: <b>{recommended}</b> periods "
-            f"(based on {self._n_points} historical points)."
-        )
+        if text != self._lbl_recommendation.text():
+            self._lbl_recommendation.setText(text)
 
+    @Slot()
     def _emit_change(self) -> None:
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
+
+    @Slot()
+    def _emit_change_now(self) -> None:
         cfg = ForecastConfig(
             enabled=self._chk_enable.isChecked(),
             horizon=self._spin_horizon.value(),
         )
+        if cfg == self._last_emitted:
+            return
+        self._last_emitted = cfg
         self.config_changed.emit(cfg)
\ No newline at end of file
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Qt, QTimer, Signal, Slot
 from PySide6.QtWidgets import (
     QAbstractItemView,
     QGroupBox,
     QLabel,
     QListWidget,
     QListWidgetItem,
+    QPlainTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -35,6 +37,21 @@ class KeyBuilder(QWidget):
 
         self._columns: list[str] = []
         self._preview_rows: list[dict[str, object]] = []
+        self._last_emitted: KeySelection | None = None
+        # Pre-stringified preview cells per column (only the rows the preview shows).
+        self._col_strs: dict[str, list[str]] = {}
+        # Selected rows (in selection order), refreshed once per coalesced selection change.
+        self._selected_indices: list[int] = []
+        self._preview_text = ""
+        # Last context (columns, caller's preview_rows object); upstream builds a fresh list per ingest.
+        self._ctx_columns: tuple[str, ...] | None = None
+        self._ctx_rows: object = None
+
+        # Coalesce a burst of itemSelectionChanged (e.g. drag-select) into one rebuild.
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._emit_selection)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
@@ -48,11 +65,21 @@ class KeyBuilder(QWidget):
 
         self._list = QListWidget()
         self._list.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        self._list.itemSelectionChanged.connect(self._emit_selection)
-
-        self._preview = QLabel("cd_key preview: (select columns)")
-        self._preview.setWordWrap(True)
-        self._preview.setStyleSheet("color: #444; padding: 8px; border: 1px solid #eee; border-radius: 8px;")
+        self._list.itemSelectionChanged.connect(self._flush_timer.start)
+
+        # Plain text only: no rich-text (QTextDocument) parse per preview refresh.
+        self._preview_header = QLabel("cd_key preview: (select columns)")
+        self._preview_header.setTextFormat(Qt.TextFormat.PlainText)
+        self._preview_header.setStyleSheet("color: #444; font-weight: 600;")
+
+        self._preview = QPlainTextEdit()
+        self._preview.setReadOnly(True)
+        self._preview.setMaximumBlockCount(self._cfg.max_preview_rows + 2)
+        self._preview.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self._preview.setFixedHeight(
+            self._preview.fontMetrics().lineSpacing() * (self._cfg.max_preview_rows + 1) + 16
+        )
+        self._preview.setStyleSheet("color: #444; padding: 4px; border: 1px solid #eee; border-radius: 8px;")
 
         hint = QLabel(
             "Tip: choose stable identifier columns (e.g., store, sku, segment). "
@@ -64,57 +91,95 @@ class KeyBuilder(QWidget):
         box_layout.addWidget(self._list)
         root.addWidget(title)
         root.addWidget(self._box)
+        root.addWidget(self._preview_header)
         root.addWidget(self._preview)
         root.addWidget(hint)
         root.addStretch(1)
 
         self.setEnabled(False)
 
-    def set_context(self, columns: list[str], preview_rows: list[dict[str, object]]) -> None:
+    def set_context(self, columns: Sequence[str], preview_rows: list[dict[str, object]]) -> None:
+        columns = tuple(columns)
+        if columns == self._ctx_columns and preview_rows is self._ctx_rows:
+            return
+        self._ctx_columns = columns
+        self._ctx_rows = preview_rows
+
+        old_columns = self._columns
         self._columns = list(columns)
         self._preview_rows = list(preview_rows)
 
-        self._list.blockSignals(True)
-        try:
+        shown = self._preview_rows[: self._cfg.max_preview_rows]
+        self._col_strs = {
+            c: ["" if (v := r.get(c, "")) is None else str(v).strip() for r in shown] for c in self._columns
+        }
+
+        if self._columns != old_columns:
+            self._list.blockSignals(True)
+            try:
+                self._sync_items(old_columns)
+            finally:
+                self._list.blockSignals(False)
+
+        self.setEnabled(bool(self._columns))
+        self._last_emitted = None
+        self._flush_timer.stop()
+        self._emit_selection()
+
+    def _sync_items(self, old_columns: list[str]) -> None:
+        """
+        Bring the list rows in line with self._columns, keeping the items (and their
+        selection) of columns that survive. Rows must end up in self._columns order.
+        """
+        new_set = set(self._columns)
+        kept = [c for c in old_columns if c in new_set]
+        kept_set = set(kept)
+        if kept != [c for c in self._columns if c in kept_set]:
+            # Surviving columns were reordered: a plain rebuild is simpler than moving rows.
             self._list.clear()
             for c in self._columns:
                 self._list.addItem(QListWidgetItem(c))
-        finally:
-            self._list.blockSignals(False)
+            return
 
-        self.setEnabled(bool(self._columns))
-        self._update_preview()
-        self._emit_selection()
+        for row in range(len(old_columns) - 1, -1, -1):
+            if old_columns[row] not in new_set:
+                self._list.takeItem(row)  # ownership returns to Python; the item is freed
+        for row, c in enumerate(self._columns):
+            if c not in kept_set:
+                self._list.insertItem(row, QListWidgetItem(c))
 
     def selection(self) -> KeySelection | None:
         if not self.isEnabled():
             return None
-        key_parts = [i.text() for i in self._list.selectedItems()]
+        key_parts = [self._columns[i] for i in self._selected_indices]
         if not key_parts:
             return None
         return KeySelection(key_parts=key_parts, separator=self._cfg.separator)
 
+    @Slot()
     def _emit_selection(self) -> None:
+        self._selected_indices = [ix.row() for ix in self._list.selectionModel().selectedIndexes()]
         sel = self.selection()
-        self._update_preview()
-        if sel is not None:
+        self._update_preview(sel)
+        if sel is not None and sel != self._last_emitted:
+            self._last_emitted = sel
             self.selection_changed.emit(sel)
 
-    def _update_preview(self) -> None:
-        sel = self.selection()
+    def _update_preview(self, sel: KeySelection | None) -> None:
         if sel is None:
-            self._preview.setText("cd_key preview: (select one or more columns)")
+            self._set_preview("cd_key preview: (select one or more columns)", "")
             return
 
-        lines: list[str] = []
         n = min(self._cfg.max_preview_rows, len(self._preview_rows))
-        for r in self._preview_rows[:n]:
-            parts = []
-            for col in sel.key_parts:
-                v = r.get(col, "")
-                s = "" if v is None else str(v).strip()
-                parts.append(s)
-            lines.append(sel.separator.join(parts))
-
-        preview_txt = "<br>".join(lines) if lines else "(no preview rows)"
-        self._preview.setText(f"<b>cd_key preview</b> ({n} rows):<br>{preview_txt}")
\ No newline at end of file
+        cols = [self._col_strs[c] for c in sel.key_parts]
+        lines = [sel.separator.join(col[i] for col in cols) for i in range(n)]
+
+        self._set_preview(f"cd_key preview ({n} rows):", "\n".join(lines) if lines else "(no preview rows)")
+
+    def _set_preview(self, header: str, text: str) -> None:
+        # Dirty checks: the header only changes with N, the body only with the selection.
+        if self._preview_header.text() != header:
+            self._preview_header.setText(header)
+        if text != self._preview_text:
+            self._preview_text = text
+            self._preview.setPlainText(text)
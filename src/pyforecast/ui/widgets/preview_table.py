@@ -1,35 +1,90 @@
 from __future__ import annotations
 
+from itertools import chain, islice
 from typing import Any, Sequence
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QPersistentModelIndex, Qt
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QHeaderView,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
 )
 
+_ROOT = QModelIndex()
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
 
-class PreviewTable(QTableWidget):
+
+def _infer_columns(rows: Sequence[dict[str, Any]], n_rendered: int) -> list[str]:
+    """Ordered union of row keys (first-seen order)."""
+    first = rows[0].keys()
+    # Fast path: uniform schema (e.g. Polars .to_dicts()), checked on every row that can be rendered.
+    if all(r.keys() == first for r in islice(rows, 1, n_rendered)):
+        return list(first)
+    return list(dict.fromkeys(chain.from_iterable(r.keys() for r in rows)))
+
+
+class PreviewTableModel(QAbstractTableModel):
+    """
+    Read-only, column-major (SoA) preview model.
+    Cells are stored as ready-to-display strings: data() is a plain list lookup.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._columns: list[str] = []
+        self._col_arrays: list[list[str]] = []
+        self._n_rows = 0
+
+    def set_columns(self, columns: list[str], col_arrays: list[list[str]]) -> None:
+        self.beginResetModel()
+        self._columns = columns
+        self._col_arrays = col_arrays
+        self._n_rows = max((len(c) for c in col_arrays), default=0)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = _ROOT) -> int:
+        return 0 if parent.isValid() else self._n_rows
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = _ROOT) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = _DISPLAY_ROLE) -> Any:
+        # Views only query valid indices; None cells are already "" in _col_arrays.
+        return self._col_arrays[index.column()][index.row()] if role == _DISPLAY_ROLE else None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = _DISPLAY_ROLE) -> Any:
+        if role != _DISPLAY_ROLE:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._columns[section]
+        return str(section + 1)
+
+
+class PreviewTable(QTableView):
     """
     Lightweight preview table optimized for:
 
-    - Small previews (<= 200 rows)
-    - Fast re-render after transform
+    - Small previews (<= 200 rows, fewer for wide data: ~MAX_PREVIEW_CELLS cells)
+    - Fast re-render after transform (one model reset, no per-cell items)
     - Safe handling of large datasets (we never render full dataset)
     """
 
     MAX_PREVIEW_ROWS = 200
+    MIN_PREVIEW_ROWS = 20
+    MAX_PREVIEW_CELLS = 20_000
     MAX_CELL_CHARS = 500
 
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
 
+        self._model = PreviewTableModel(self)
+        self.setModel(self._model)
+
         self.setAlternatingRowColors(True)
         self.setSortingEnabled(False)
-        self.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.setSelectionBehavior(QTableWidget.SelectRows)
-        self.setSelectionMode(QTableWidget.SingleSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
 
         self.verticalHeader().setVisible(False)
         self.horizontalHeader().setStretchLastSection(True)
@@ -42,33 +97,42 @@ class PreviewTable(QTableWidget):
     def set_preview_rows(self, rows: Sequence[dict[str, Any]]) -> None:
         """
         Accepts list[dict] (as produced by Polars .to_dicts()).
-        Only renders first MAX_PREVIEW_ROWS.
+        Only renders the first _row_budget(len(columns)) rows.
         """
-        self.setUpdatesEnabled(False)
-        try:
-            self.clear()
-
-            if not rows:
-                self.setRowCount(0)
-                self.setColumnCount(0)
-                return
-
-            rows = rows[: self.MAX_PREVIEW_ROWS]
-            columns = list(rows[0].keys())
+        if not rows:
+            self.set_preview_columns([], [])
+            return
 
-            self.setColumnCount(len(columns))
-            self.setHorizontalHeaderLabels(columns)
-            self.setRowCount(len(rows))
+        # Budget never exceeds MAX_PREVIEW_ROWS, so those are the only rows that can be shown.
+        columns = _infer_columns(rows, self.MAX_PREVIEW_ROWS)
+        rows = rows[: self._row_budget(len(columns))]
+        self.set_preview_columns(columns, [[row.get(col) for row in rows] for col in columns])
 
-            for r_idx, row in enumerate(rows):
-                for c_idx, col in enumerate(columns):
-                    value = row.get(col)
-                    item = QTableWidgetItem(self._format_cell(value))
-                    item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    self.setItem(r_idx, c_idx, item)
-
-            self._auto_resize_columns(columns)
+    def set_preview_columns(self, columns: Sequence[str], values: Sequence[Sequence[Any]]) -> None:
+        """
+        Column-major variant: values[c] holds the cells of columns[c]
+        (e.g. [s.to_list() for s in df.get_columns()]), so no per-row dicts are built.
+        Only renders the first _row_budget(len(columns)) rows.
+        """
+        columns = [str(c) for c in columns]
+        n_rows = self._row_budget(len(columns))
+
+        # Stringify + truncate once here, inlined (no per-cell method call); the model
+        # only hands out prepared strings.
+        mcc = self.MAX_CELL_CHARS
+        texts = [
+            [
+                "" if v is None else (s if len(s := str(v)) <= mcc else s[:mcc] + "…")
+                for v in col_values[:n_rows]
+            ]
+            for col_values in values
+        ]
 
+        self.setUpdatesEnabled(False)
+        try:
+            self._model.set_columns(columns, texts)
+            if columns:
+                self._auto_resize_columns(columns)
         finally:
             self.setUpdatesEnabled(True)
 
@@ -76,14 +140,10 @@ class PreviewTable(QTableWidget):
     # Internal helpers
     # ---------------------------------------------------
 
-    def _format_cell(self, value: Any) -> str:
-        if value is None:
-            return ""
-
-        text = str(value)
-        if len(text) > self.MAX_CELL_CHARS:
-            return text[: self.MAX_CELL_CHARS] + "…"
-        return text
+    def _row_budget(self, n_cols: int) -> int:
+        """Scale rows inversely with width so wide inputs stay around MAX_PREVIEW_CELLS cells."""
+        by_cells = self.MAX_PREVIEW_CELLS // max(1, n_cols)
+        return max(self.MIN_PREVIEW_ROWS, min(self.MAX_PREVIEW_ROWS, by_cells))
 
     def _auto_resize_columns(self, columns: list[str]) -> None:
 
@@ -95,4 +155,4 @@ class PreviewTable(QTableWidget):
             header.setSectionResizeMode(QHeaderView.Interactive)
 
         for i in range(len(columns)):
-            header.resizeSection(i, min(240, header.sectionSize(i)))
\ No newline at end of file
+            header.resizeSection(i, min(240, header.sectionSize(i)))
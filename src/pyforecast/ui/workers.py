@@ -1,16 +1,18 @@
 from __future__ import annotations
  
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Generic, TypeVar
  
-from PySide6.QtCore import QObject, QThread, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
  
 from pyforecast.application.services import (
     ForecastRequest,
-    ForecastResult,
+    IngestService,
     TransformRequest,
-    TransformResult,
     forecast_prophet,
     transform_to_canonical_long,
 )
@@ -19,6 +21,12 @@ from pyforecast.infrastructure.logging import get_logger
  
 log = get_logger(__name__)
 
+_T = TypeVar("_T")
+_R = TypeVar("_R", bound="_Runner")
+
+# Keeps runners alive until their job is done, even if the caller drops its handle.
+_ACTIVE: set[_Runner] = set()
+
  
 class _Runner(QObject):
 
@@ -27,14 +35,29 @@ class _Runner(QObject):
     finished = Signal(object)    # result object (TransformResult/ForecastResult)
     failed = Signal(str)         # user-friendly message
     cancelled = Signal()
+    done = Signal()              # always emitted last, whatever the outcome
  
     def __init__(self) -> None:
         super().__init__()
         self._cancel_requested = False
+        self._running = threading.Event()
  
+    @Slot()
     def request_cancel(self) -> None:
         self._cancel_requested = True
  
+    def is_running(self) -> bool:
+        return self._running.is_set()
+ 
+    def run(self) -> None:
+        """The job body; runs on a pooled thread. Must emit exactly one of finished/failed/cancelled."""
+        ...
+ 
+    @Slot()
+    def _release(self) -> None:
+        # Queued onto the UI thread (the runner's thread), so the last reference drops there.
+        _ACTIVE.discard(self)
+ 
     def _check_cancel(self) -> None:
         if self._cancel_requested:
             raise _Cancelled()
@@ -48,17 +71,86 @@ class _Cancelled(Exception):
     pass
  
  
+class _RunnableAdapter(QRunnable):
+    """Runs a _Runner's job on a pooled thread; the runner (and its signals) stays on the UI thread."""
+ 
+    def __init__(self, runner: _Runner) -> None:
+        super().__init__()
+        self._runner = runner
+        self.setAutoDelete(True)
+ 
+    def run(self) -> None:
+        try:
+            self._runner.run()
+        finally:
+            self._runner._running.clear()
+            self._runner.done.emit()
+ 
+ 
+class _CallRunnable(QRunnable):
+    """Runs a plain callable on a pooled thread and settles a Future with its outcome."""
+
+    def __init__(self, future: Future[Any], fn: Callable[..., Any], args: tuple[Any, ...]) -> None:
+        super().__init__()
+        self._future = future
+        self._fn = fn
+        self._args = args
+        self.setAutoDelete(True)
+
+    def run(self) -> None:
+        if not self._future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self._fn(*self._args)
+        except BaseException as exc:
+            self._future.set_exception(exc)
+        else:
+            self._future.set_result(result)
+
+
 @dataclass(frozen=True)
-class ThreadHandle:
+class ThreadHandle(Generic[_R]):
 
-    thread: QThread
-    runner: _Runner
+    runner: _R
  
     def cancel(self) -> None:
         self.runner.request_cancel()
  
     def is_running(self) -> bool:
-        return self.thread.isRunning()
+        return self.runner.is_running()
+ 
+class IngestWorker(_Runner):
+
+    failed_unexpected = Signal(str)  # non-PyForecastError failures (bugs, I/O surprises)
+ 
+    def __init__(self, ingest: IngestService, path: Path) -> None:
+        super().__init__()
+        self._ingest = ingest
+        self._path = path
+ 
+    @Slot()
+    def run(self) -> None:
+        self.started.emit()
+        try:
+            self._emit_progress(5, "Reading file…")
+            self._check_cancel()
+ 
+            data = self._ingest.ingest(self._path)
+            self._check_cancel()
+ 
+            self._emit_progress(100, "File loaded.")
+            self.finished.emit(data)
+ 
+        except _Cancelled:
+            log.info("ingest_cancelled", extra={"path": str(self._path)})
+            self.cancelled.emit()
+        except PyForecastError as exc:
+            log.warning("ingest_failed", extra={"path": str(self._path), "error": str(exc)})
+            self.failed.emit(str(exc))
+        except Exception as exc:
+            # last-resort to avoid UI crash
+            log.exception("ingest_failed_unexpected", extra={"path": str(self._path), "error": str(exc)})
+            self.failed_unexpected.emit(f"Unexpected error while opening file: {exc}")
  
 class TransformWorker(_Runner):
  
@@ -124,37 +216,32 @@ class ForecastWorker(_Runner):
             log.exception("forecast_failed_unexpected", extra={"error": str(exc)})
             self.failed.emit(f"Unexpected error during forecast: {exc}")
  
-def start_transform_thread(req: TransformRequest) -> ThreadHandle:
-    thread = QThread()
-    worker = TransformWorker(req)
-    worker.moveToThread(thread)
+def _start(runner: _R) -> ThreadHandle[_R]:
+    # Reuse QThreadPool's threads instead of creating a QThread per job.
+    runner._running.set()
+    _ACTIVE.add(runner)
+    runner.done.connect(runner._release)
+    # Submit on the next event-loop turn: callers connect to the runner's signals right after
+    # this returns, and a fast job would otherwise emit finished/failed before anyone listens.
+    pool = QThreadPool.globalInstance()
+    QTimer.singleShot(0, lambda: pool.start(_RunnableAdapter(runner)))
+    return ThreadHandle(runner=runner)
  
-    thread.started.connect(worker.run)
-    # Cleanup
-    worker.finished.connect(lambda _: thread.quit())
-    worker.failed.connect(lambda _: thread.quit())
-    worker.cancelled.connect(thread.quit)
  
-    thread.finished.connect(worker.deleteLater)
-    thread.finished.connect(thread.deleteLater)
+def start_ingest_thread(ingest: IngestService, path: Path) -> ThreadHandle[IngestWorker]:
+    return _start(IngestWorker(ingest, path))
  
-    thread.start()
-    return ThreadHandle(thread=thread, runner=worker)
  
+def start_transform_thread(req: TransformRequest) -> ThreadHandle[TransformWorker]:
+    return _start(TransformWorker(req))
  
-def start_forecast_thread(req: ForecastRequest) -> ThreadHandle:
-
-    thread = QThread()
-    worker = ForecastWorker(req)
-    worker.moveToThread(thread)
- 
-    thread.started.connect(worker.run)
-    worker.finished.connect(lambda _: thread.quit())
-    worker.failed.connect(lambda _: thread.quit())
-    worker.cancelled.connect(thread.quit)
- 
-    thread.finished.connect(worker.deleteLater)
-    thread.finished.connect(thread.deleteLater)
  
-    thread.start()
-    return ThreadHandle(thread=thread, runner=worker)
\ No newline at end of file
+def start_forecast_thread(req: ForecastRequest) -> ThreadHandle[ForecastWorker]:
+    return _start(ForecastWorker(req))
+
+
+def run_in_background(fn: Callable[..., _T], *args: Any) -> Future[_T]:
+    """Run `fn(*args)` on the shared QThreadPool; .result() returns its value (or raises)."""
+    future: Future[_T] = Future()
+    QThreadPool.globalInstance().start(_CallRunnable(future, fn, args))
+    return future
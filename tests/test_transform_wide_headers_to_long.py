@@ -1,90 +1,126 @@
 from __future__ import annotations
  
+import io
+import time
 from pathlib import Path
  
 import polars as pl
 import pytest
  
+from pyforecast.application.services import IngestService, build_cd_key_for_preview, transform_service
 from pyforecast.application.services.transform_service import TransformRequest, transform_to_canonical_long
 from pyforecast.domain.canonical_schema import CANON
  
  
-@pytest.mark.parametrize(
-    "headers",
-    [
-        ["2024-01-01", "2024-01-02", "2024-01-03"],
-        ["2024-01", "2024-02", "2024-03"],  # monthly headers
-        ["20240101", "20240102", "20240103"],  # compact daily
-    ],
-)
-def test_transform_wide_header_dates_to_canonical_long(tmp_path: Path, headers: list[str]) -> None:
+_KEY_COLUMNS = {"sku": ["A", "B"], "store": ["1", "1"]}
+ 
+_HEADER_VARIANTS = [
+    ["2024-01-01", "2024-01-02", "2024-01-03"],
+    ["2024-01", "2024-02", "2024-03"],  # monthly headers
+    ["20240101", "20240102", "20240103"],  # compact daily
+]
+ 
+ 
+@pytest.fixture(scope="session", params=_HEADER_VARIANTS, ids=["daily", "monthly", "compact"])
+def wide_input(request: pytest.FixtureRequest) -> tuple[bytes, list[str]]:
+    """Wide input as Arrow IPC bytes (keys + date-in-header value columns), built once per header variant."""
+    headers: list[str] = request.param
+    df = pl.DataFrame(
+        {
+            **_KEY_COLUMNS,
+            headers[0]: [10, 5],
+            headers[1]: [11, 6],
+            headers[2]: [12, 7],
+        }
+    )
+    return df.write_ipc(None).getvalue(), headers
+ 
+ 
+@pytest.fixture(scope="session")
+def wide_input_single_series() -> bytes:
+    df = pl.DataFrame(
+        {
+            "sku": ["A"],
+            "store": ["1"],
+            "2024-01-01": [10],
+            "2024-01-02": [11],
+        }
+    )
+    return df.write_ipc(None).getvalue()
+ 
+ 
+@pytest.fixture(scope="module")
+def out_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One output directory for the module; each test reads its output right after writing it."""
+    return tmp_path_factory.mktemp("wide_out")
+ 
+ 
+@pytest.mark.parametrize("key_parts", [["store", "sku"], ["sku", "store"]])
+def test_transform_wide_header_dates_to_canonical_long(
+    out_dir: Path, wide_input: tuple[bytes, list[str]], key_parts: list[str]
+) -> None:
     """
     Wide variant (header dates):
-      - key columns identify the series (row)
+      - key columns identify the series (row) and are NOT melted as dates
       - date values live in column headers
       - output must be canonical: cd_key, ds, y
       - ds must be non-null and parsed from headers
     """
-    # Create a wide dataframe: keys + date-in-header value columns
-    data = {
-        "sku": ["A", "B"],
-        "store": ["1", "1"],
-        headers[0]: [10, 5],
-        headers[1]: [11, 6],
-        headers[2]: [12, 7],
-    }
-    df = pl.DataFrame(data)
- 
-    in_path = tmp_path / "wide_headers.csv"
-    df.write_csv(in_path)
+    data, _headers = wide_input
  
     req = TransformRequest(
-        path=in_path,
-        file_type="csv",
+        path=io.BytesIO(data),
+        file_type="ipc",
         shape="wide",
         # In header-wide mode this might be meaningless; we still pass a value.
         # The service should still correctly parse ds from header names.
         date_col="date",
         value_col=None,
-        key_parts=["store", "sku"],
+        key_parts=key_parts,
         key_separator="|",
-        out_dir=tmp_path,
-        out_format="parquet",
+        out_dir=out_dir,
+        out_format="ipc",
     )
  
     res = transform_to_canonical_long(req)
     assert res.output_path.exists()
  
-    out = pl.read_parquet(res.output_path)
+    out = pl.read_ipc(res.output_path)
  
-    # Canonical columns exist
-    assert set(out.columns) == {CANON.cd_key, CANON.ds, CANON.y}
+    # Canonical columns, in canonical order
+    assert out.columns == [CANON.cd_key, CANON.ds, CANON.y]
  
     # ds should be parsed (no nulls for these 3 periods * 2 series = 6 rows)
     assert out.height == 6
     assert out[CANON.ds].null_count() == 0
  
-    # cd_key should be store|sku (2 unique keys)
-    assert set(out[CANON.cd_key].unique().to_list()) == {"1|A", "1|B"}
+    # cd_key follows key_parts order (2 unique keys)
+    expected_keys = ["|".join(vals) for vals in zip(*(_KEY_COLUMNS[k] for k in key_parts), strict=True)]
+    assert out[CANON.cd_key].n_unique() == 2
+    assert out[CANON.cd_key].is_in(expected_keys).all()
  
     # y should contain all input values (order not guaranteed)
-    assert sorted(out[CANON.y].to_list()) == sorted([10, 11, 12, 5, 6, 7])
+    assert out[CANON.y].sort().equals(pl.Series(CANON.y, [5, 6, 7, 10, 11, 12], dtype=pl.Float64))
  
  
-def test_transform_wide_header_dates_ignores_key_columns(tmp_path: Path) -> None:
-    """
-    Ensures we do NOT melt key columns as dates.
-    """
-    df = pl.DataFrame(
-        {
-            "sku": ["A"],
-            "store": ["1"],
-            "2024-01-01": [10],
-            "2024-01-02": [11],
-        }
+def test_transform_request_is_slotted(tmp_path: Path) -> None:
+    """Requests are frozen, keyword-only and slotted (no per-instance __dict__)."""
+    assert TransformRequest.__slots__
+    req = TransformRequest(
+        path=tmp_path / "in.csv",
+        file_type="csv",
+        shape="wide",
+        date_col="date",
+        value_col=None,
+        key_parts=["sku"],
     )
+    assert not hasattr(req, "__dict__")
+ 
+ 
+def test_transform_wide_header_dates_from_csv(tmp_path: Path) -> None:
+    """CSV input is read without dtype inference: keys stay strings (leading zeros kept)."""
     in_path = tmp_path / "wide_headers.csv"
-    df.write_csv(in_path)
+    in_path.write_text("sku,store,2024-01-01,2024-01-02\nA,01,10,\"1.234,5\"\n", encoding="utf-8")
  
     req = TransformRequest(
         path=in_path,
@@ -92,15 +128,296 @@ def test_transform_wide_header_dates_ignores_key_columns(tmp_path: Path) -> None
         shape="wide",
         date_col="date",
         value_col=None,
-        key_parts=["sku", "store"],
+        key_parts=["store", "sku"],
         out_dir=tmp_path,
+        out_format="ipc",
+    )
+    out = pl.read_ipc(transform_to_canonical_long(req).output_path)
+ 
+    assert out.height == 2
+    assert out[CANON.cd_key].is_in(["01|A"]).all()
+    assert out[CANON.y].sort().equals(pl.Series(CANON.y, [10.0, 1234.5]))
+ 
+ 
+def test_csv_ingest_preview_keys_match_transform_output(tmp_path: Path) -> None:
+    """The cd_key preview built from ingested rows matches what the transform writes."""
+    in_path = tmp_path / "wide_headers.csv"
+    in_path.write_text("sku,store,2024-01-01,2024-01-02\nA,01,10,20\nB,002,30,40\n", encoding="utf-8")
+ 
+    data = IngestService().ingest(in_path)
+    preview_keys = build_cd_key_for_preview(data.preview_rows, list(data.columns), ["store", "sku"])
+ 
+    req = TransformRequest(
+        path=in_path,
+        file_type="csv",
+        shape="wide",
+        date_col="date",
+        value_col=None,
+        key_parts=["store", "sku"],
+        out_dir=tmp_path,
+        out_format="ipc",
+    )
+    out = pl.read_ipc(transform_to_canonical_long(req).output_path)
+ 
+    assert preview_keys == ["01|A", "002|B"]
+    assert set(out[CANON.cd_key].unique().to_list()) == set(preview_keys)
+ 
+ 
+@pytest.mark.parametrize("parquet_engine", ["polars", "pyarrow"])
+def test_transform_wide_header_dates_parquet_output(
+    out_dir: Path, wide_input_single_series: bytes, parquet_engine: str
+) -> None:
+    """Canary for the parquet writers (the other tests use uncompressed IPC output)."""
+    if parquet_engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+ 
+    req = TransformRequest(
+        path=io.BytesIO(wide_input_single_series),
+        file_type="ipc",
+        shape="wide",
+        date_col="date",
+        value_col=None,
+        key_parts=["sku", "store"],
+        out_dir=out_dir,
         out_format="parquet",
+        parquet_engine=parquet_engine,
     )
     res = transform_to_canonical_long(req)
+    assert res.output_path.suffix == ".parquet"
  
     out = pl.read_parquet(res.output_path)
+    assert out.columns == [CANON.cd_key, CANON.ds, CANON.y]
+    assert out.height == 2
+    assert out[CANON.ds].null_count() == 0
+ 
+ 
+def _chunked_long_input(n_chunks: int) -> pl.DataFrame:
+    """Long-shape frame made of n_chunks separate chunks (unpivot would rechunk on its own)."""
+    small = pl.DataFrame({"sku": ["A", "B"], "date": ["2024-01-01", "2024-01-02"], "value": ["1", "2"]})
+    return pl.concat([small] * n_chunks, rechunk=False)
+ 
+ 
+def _chunked_long_request(
+    monkeypatch: pytest.MonkeyPatch, out_dir: Path, chunked: pl.DataFrame, parquet_engine: str = "polars"
+) -> TransformRequest:
+    # Feed the in-memory chunked frame straight into the pipeline.
+    monkeypatch.setattr(transform_service, "_scan_input", lambda *_args: chunked.lazy())
+    return TransformRequest(
+        path=io.BytesIO(),
+        file_type="ipc",
+        shape="long",
+        date_col="date",
+        value_col="value",
+        key_parts=["sku"],
+        out_dir=out_dir,
+        out_format="parquet",
+        parquet_engine=parquet_engine,
+    )
+ 
+ 
+@pytest.mark.parametrize("parquet_engine", ["polars", "pyarrow"])
+def test_transform_chunked_input_is_rechunked_before_parquet_write(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, parquet_engine: str
+) -> None:
+    """A heavily chunked result must reach the parquet writer as one contiguous chunk."""
+    if parquet_engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+ 
+    chunked = _chunked_long_input(1000)
+    assert chunked.lazy().select(pl.all()).collect().n_chunks() > 1
+ 
+    written_chunks: list[int] = []
+    real_write = pl.DataFrame.write_parquet
+ 
+    def _spy_write(self: pl.DataFrame, *args: object, **kwargs: object) -> None:
+        written_chunks.append(self.n_chunks())
+        real_write(self, *args, **kwargs)
+ 
+    monkeypatch.setattr(pl.DataFrame, "write_parquet", _spy_write)
+ 
+    req = _chunked_long_request(monkeypatch, tmp_path, chunked, parquet_engine)
+    res = transform_to_canonical_long(req)
+ 
+    assert written_chunks == [1]
+    assert pl.read_parquet(res.output_path).height == 2000
+ 
+ 
+@pytest.mark.slow
+def test_transform_chunked_parquet_write_is_fast(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Chunked writes degrade by orders of magnitude; rechunked output stays well within budget."""
+    req = _chunked_long_request(monkeypatch, tmp_path, _chunked_long_input(10_000))
+ 
+    t0 = time.perf_counter()
+    res = transform_to_canonical_long(req)
+    elapsed = time.perf_counter() - t0
+ 
+    assert pl.read_parquet(res.output_path).height == 20_000
+    assert elapsed < 5.0
+ 
+ 
+def test_transform_large_parquet_output_streams(
+    out_dir: Path, wide_input_single_series: bytes, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Inputs at/above the threshold are written through the streaming sink, with the same output."""
+    calls = 0
+    real_sink = transform_service._sink_parquet_streaming
+ 
+    def _counting_sink(*args: object, **kwargs: object) -> None:
+        nonlocal calls
+        calls += 1
+        real_sink(*args, **kwargs)
  
-    # Only 2 melted periods => 2 rows
+    monkeypatch.setattr(transform_service, "_STREAMING_WRITE_MIN_BYTES", 0)
+    monkeypatch.setattr(transform_service, "_sink_parquet_streaming", _counting_sink)
+ 
+    req = TransformRequest(
+        path=io.BytesIO(wide_input_single_series),
+        file_type="ipc",
+        shape="wide",
+        date_col="date",
+        value_col=None,
+        key_parts=["sku", "store"],
+        out_dir=out_dir,
+        out_format="parquet",
+    )
+    out = pl.read_parquet(transform_to_canonical_long(req).output_path)
+ 
+    assert calls == 1
+    assert out.columns == [CANON.cd_key, CANON.ds, CANON.y]
     assert out.height == 2
+    assert out[CANON.y].sort().equals(pl.Series(CANON.y, [10.0, 11.0]))
+ 
+ 
+def test_transform_wide_parquet_output_streams_on_unpivoted_size(
+    out_dir: Path, wide_input_single_series: bytes, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Wide inputs below the threshold still stream when the unpivot grows them past it."""
+    calls = 0
+ 
+    def _counting_sink(*_args: object, **_kwargs: object) -> None:
+        nonlocal calls
+        calls += 1
+ 
+    # Two period columns: the estimate is 2x the input, so input + 1 byte is crossed.
+    monkeypatch.setattr(transform_service, "_STREAMING_WRITE_MIN_BYTES", len(wide_input_single_series) + 1)
+    monkeypatch.setattr(transform_service, "_sink_parquet_streaming", _counting_sink)
+ 
+    req = TransformRequest(
+        path=io.BytesIO(wide_input_single_series),
+        file_type="ipc",
+        shape="wide",
+        date_col="date",
+        value_col=None,
+        key_parts=["sku", "store"],
+        out_dir=out_dir,
+        out_format="parquet",
+    )
+    transform_to_canonical_long(req)
+ 
+    assert calls == 1
+ 
+ 
+def test_transform_small_parquet_output_does_not_stream(
+    out_dir: Path, wide_input_single_series: bytes, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Small outputs take collect().write_parquet(), not the (slower) streaming sink."""
+ 
+    def _no_sink(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("streaming sink must not be used for small inputs")
+ 
+    monkeypatch.setattr(transform_service, "_sink_parquet_streaming", _no_sink)
+ 
+    req = TransformRequest(
+        path=io.BytesIO(wide_input_single_series),
+        file_type="ipc",
+        shape="wide",
+        date_col="date",
+        value_col=None,
+        key_parts=["sku", "store"],
+        out_dir=out_dir,
+        out_format="parquet",
+    )
+    res = transform_to_canonical_long(req)
+    assert pl.read_parquet(res.output_path).height == 2
+ 
+ 
+@pytest.mark.slow
+def test_transform_wide_large_stays_vectorized(tmp_path: Path) -> None:
+    """
+    Guard against regressions to Python-level loops in the wide path:
+    100k series x 50 period columns must stay well within a vectorized budget.
+    """
+    n_rows = 100_000
+    headers = [f"2024-{m:02d}-{d:02d}" for m in range(1, 3) for d in range(1, 26)]
+    df = pl.select(
+        pl.int_range(n_rows).cast(pl.Utf8).alias("sku"),
+        pl.lit("1").alias("store"),
+        *[pl.int_range(n_rows).alias(h) for h in headers],
+    )
+    req = TransformRequest(
+        path=io.BytesIO(df.write_ipc(None).getvalue()),
+        file_type="ipc",
+        shape="wide",
+        date_col="date",
+        value_col=None,
+        key_parts=["store", "sku"],
+        out_dir=tmp_path,
+        out_format="ipc",
+    )
+    t0 = time.perf_counter()
+    res = transform_to_canonical_long(req)
+    elapsed = time.perf_counter() - t0
+ 
+    out = pl.read_ipc(res.output_path)
+    assert out.height == n_rows * len(headers)
     assert out[CANON.ds].null_count() == 0
-    assert set(out[CANON.cd_key].unique().to_list()) == {"A|1"}
\ No newline at end of file
+    # ~2s locally for 5M output rows; a per-row Python loop would take minutes.
+    assert elapsed < 10.0
+ 
+ 
+def test_second_call_is_cached(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Identical request on an unchanged file reuses the result; changed inputs/outputs do not."""
+    in_path = tmp_path / "cached.csv"
+    in_path.write_text("store,sku,2024-01-01,2024-01-02\n1,A,1,2\n", encoding="utf-8")
+ 
+    def _req(key_parts: list[str]) -> TransformRequest:
+        return TransformRequest(
+            path=in_path,
+            file_type="csv",
+            shape="wide",
+            date_col="date",
+            value_col=None,
+            key_parts=key_parts,
+            out_dir=tmp_path,
+            out_format="ipc",
+        )
+ 
+    # Simulate a coarse-timestamp filesystem (FAT/HFS+): only the size tells rewrites apart.
+    monkeypatch.setattr(transform_service, "_file_signature", lambda path: (0, path.stat().st_size))
+    first = transform_to_canonical_long(_req(["store", "sku"]))
+ 
+    calls = 0
+    real_scan = transform_service._scan_input
+ 
+    def _counting_scan(*args: object, **kwargs: object) -> pl.LazyFrame:
+        nonlocal calls
+        calls += 1
+        return real_scan(*args, **kwargs)
+ 
+    monkeypatch.setattr(transform_service, "_scan_input", _counting_scan)
+ 
+    assert transform_to_canonical_long(_req(["store", "sku"])) == first
+    assert calls == 0
+ 
+    # A swapped key order rewrites the same output path with the same byte count.
+    transform_to_canonical_long(_req(["sku", "store"]))
+    assert calls == 1
+    res = transform_to_canonical_long(_req(["store", "sku"]))
+    assert calls == 2
+    assert pl.read_ipc(res.output_path)[CANON.cd_key].unique().to_list() == ["1|A"]
+ 
+    # Changing the input invalidates too.
+    in_path.write_text("store,sku,2024-01-01,2024-01-02\n1,A,1,2\n1,B,3,4\n", encoding="utf-8")
+    out = pl.read_ipc(transform_to_canonical_long(_req(["store", "sku"])).output_path)
+    assert calls == 3
+    assert out.height == 4